@@ -0,0 +1,590 @@
+import json
+import os
+import sys
+import threading
+import time
+import orjson
+import requests
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+
+CONFIG_FILE = "config/nodes.json"
+STATE_FILE = "config/state.json"  # Block history and sync status carried across restarts
+CHECK_INTERVAL = 120  # seconds
+MAX_PARALLEL_POLLS = 32  # Upper bound on concurrent RPC calls and pooled connections per host
+
+CONFIG = {}
+NTFY_TOPIC = ""
+NODES = {}
+SYNCED_NODES = {}  # Tracks sync status and the number of consecutive synced observations
+SYNCED_STREAK_THRESHOLD = 2  # Synced observations before polling system_health only
+FULL_REFRESH_CYCLES = 10  # Fetch the full sync state at least every N cycles
+check_cycle = 0  # Number of completed check_nodes cycles
+node_block_history = {}  # Stores previous block height, timestamp and smoothed sync speed
+SYNC_SPEED_SMOOTHING = 0.2  # EMA weight given to the newest sync speed sample
+ETA_MAX_SPEED_DEVIATION = 1.0  # Hide ETA when speed std-dev exceeds this share of the mean
+
+# Shared HTTP session so RPC and ntfy connections are kept alive between polls
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=MAX_PARALLEL_POLLS, pool_maxsize=MAX_PARALLEL_POLLS, max_retries=0
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+# JSON-RPC request bodies never change, so encode them once up front
+JSON_HEADERS = {"Content-Type": "application/json"}
+RPC_REQUESTS = {
+    "system_health": {"jsonrpc": "2.0", "method": "system_health", "params": [], "id": 1},
+    "system_syncState": {"jsonrpc": "2.0", "method": "system_syncState", "params": [], "id": 2},
+}
+HEALTH_METHODS = ("system_health",)
+SYNC_STATE_METHODS = ("system_syncState",)
+HEALTH_AND_SYNC_METHODS = HEALTH_METHODS + SYNC_STATE_METHODS
+# Single calls go out as a bare request object, since not every node accepts batches
+RPC_PAYLOADS = {
+    methods: orjson.dumps(
+        [RPC_REQUESTS[method] for method in methods]
+        if len(methods) > 1
+        else RPC_REQUESTS[methods[0]]
+    )
+    for methods in (HEALTH_METHODS, SYNC_STATE_METHODS, HEALTH_AND_SYNC_METHODS)
+}
+
+# Worker pool so nodes are polled concurrently instead of one after another
+EXECUTOR = ThreadPoolExecutor(max_workers=MAX_PARALLEL_POLLS)
+
+# Short-lived cache of RPC results so repeated lookups within the TTL skip the network.
+# Entries are stamped with the time the request was sent, so a slow node is still
+# polled afresh on every 5 s TUI refresh; the CLI's interval never hits it.
+RPC_CACHE_TTL = 4  # seconds
+rpc_cache = {}  # (url, methods) -> (request timestamp, result)
+rpc_cache_lock = threading.Lock()
+
+# Nodes that answered a JSON-RPC batch with an error; they are polled one method at a time
+batch_unsupported_urls = set()
+
+logger = logging.getLogger("SyncChecker")
+
+
+class JSONLogFormatter(logging.Formatter):
+    """Format log records as single-line JSON objects.
+
+    Records logged with ``extra={"event": ..., "fields": {...}}`` are emitted as
+    the event name plus its fields, without interpolating the human-readable message.
+    """
+
+    def format(self, record):
+        entry = {"time": self.formatTime(record, self.datefmt), "level": record.levelname}
+        fields = getattr(record, "fields", None)
+        if fields is not None:
+            entry["event"] = getattr(record, "event", None)
+            entry.update(fields)
+        else:
+            entry["message"] = record.getMessage()
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry).decode("utf-8")
+
+
+# Logging formats: colored text on a terminal, JSON lines for files and journald
+COLOR_LOG_FORMAT = "\033[1;34m%(asctime)s\033[0m - \033[1;32m%(levelname)s\033[0m - %(message)s"
+LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def setup_logging():
+    """Configure root logging for the CLI monitor."""
+    log_handler = logging.StreamHandler()
+    if sys.stderr.isatty():
+        log_handler.setFormatter(logging.Formatter(COLOR_LOG_FORMAT, datefmt=LOG_DATE_FORMAT))
+    else:
+        log_handler.setFormatter(JSONLogFormatter(datefmt=LOG_DATE_FORMAT))
+    logging.basicConfig(level=logging.INFO, handlers=[log_handler])
+
+
+def load_config(config_file):
+    """Read and parse a JSON config file."""
+    return orjson.loads(Path(config_file).read_bytes())
+
+
+def load_nodes(config):
+    """Map node names to RPC URLs from a parsed config.
+
+    Raises ValueError if the config doesn't have the expected shape.
+    """
+    if not isinstance(config, dict):
+        raise ValueError("config must be a JSON object")
+
+    if "nodes" in config:
+        nodes_config = config["nodes"]
+        if not isinstance(nodes_config, dict) or not all(
+            isinstance(data, dict) and isinstance(data.get("url"), str)
+            for data in nodes_config.values()
+        ):
+            raise ValueError('every entry under "nodes" needs a "url" string')
+        return {node: data["url"] for node, data in nodes_config.items()}
+
+    # Flat {"node-name": "url"} layout
+    if not all(isinstance(url, str) for url in config.values()):
+        raise ValueError("every node in a flat config needs a URL string")
+    return dict(config)
+
+
+def save_config():
+    """Save the current config state to the config file."""
+    global CONFIG
+    try:
+        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
+            json.dump(CONFIG, f, indent=2)
+        logger.info("💾 Config file updated successfully")
+    except Exception as e:
+        logger.error("⚠️ Failed to save config file: %s", e)
+
+
+def save_state():
+    """Persist block history and sync status so rates survive a restart."""
+    # Monotonic timestamps don't carry over between processes, so store wall-clock time
+    clock_offset = time.time() - time.monotonic()
+    state = {
+        "history": {
+            node: [block, timestamp + clock_offset, speed, variance]
+            for node, (block, timestamp, speed, variance) in node_block_history.items()
+        },
+        "synced": SYNCED_NODES,
+    }
+    temporary_state_file = f"{STATE_FILE}.tmp"
+    try:
+        # Write to a temporary file first so a crash never leaves a truncated state file
+        with open(temporary_state_file, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(temporary_state_file, STATE_FILE)
+    except OSError as e:
+        logger.error("⚠️ Failed to save state file: %s", e)
+
+
+def load_state():
+    """Restore block history and sync status saved by a previous run."""
+    try:
+        with open(STATE_FILE, "r", encoding="utf-8") as f:
+            state = json.load(f)
+
+        clock_offset = time.time() - time.monotonic()
+        for node, (block, timestamp, speed, variance) in state.get("history", {}).items():
+            if node in NODES:
+                node_block_history[node] = (block, timestamp - clock_offset, speed, variance)
+        for node, sync_state in state.get("synced", {}).items():
+            if node in SYNCED_NODES:
+                SYNCED_NODES[node].update(sync_state)
+    except FileNotFoundError:
+        return  # First run, nothing to restore
+    except (OSError, ValueError, TypeError) as e:
+        logger.warning("⚠️ Ignoring unreadable state file: %s", e)
+        return
+
+    logger.info("📂 Restored state for %s node(s)", len(node_block_history))
+
+
+def send_ntfy_notification(node_identifier):
+    """Send a notification when a node gets fully synced."""
+    global CONFIG
+    message = f"✅ {node_identifier} is now fully synced! 🎉🚀"
+    try:
+        SESSION.post(
+            f"https://ntfy.sh/{NTFY_TOPIC}", data=message.encode("utf-8"), timeout=5
+        )
+        logger.info("📢 [%s] Sent notification: %s", node_identifier, message)
+
+        # Update notified status in config
+        if node_identifier in CONFIG.get("nodes", {}):
+            CONFIG["nodes"][node_identifier]["notified"] = True
+            save_config()
+    except requests.RequestException as e:
+        logger.error("⚠️ [%s] Failed to send notification: %s", node_identifier, e)
+
+
+def split_time_duration(total_seconds):
+    """Split total seconds into whole (days, hours, minutes, seconds)."""
+    days, remainder = divmod(int(total_seconds), 86400)
+    hours, remainder = divmod(remainder, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return days, hours, minutes, seconds
+
+
+def format_time_duration(total_seconds):
+    """Convert total seconds into a human-readable time duration."""
+    days, hours, minutes, seconds = split_time_duration(total_seconds)
+
+    parts = []
+    if days > 0:
+        parts.append(f"{days}d")
+    if hours > 0:
+        parts.append(f"{hours}h")
+    if minutes > 0:
+        parts.append(f"{minutes}m")
+    if seconds > 0 or not parts:
+        parts.append(f"{seconds}s")
+
+    return " ".join(parts)
+
+
+def format_duration_to_minutes(total_seconds):
+    """Convert total seconds into a days/hours/minutes duration string."""
+    days, hours, minutes, _ = split_time_duration(total_seconds)
+
+    if days > 0:
+        return f"{days}d {hours}h {minutes}m"
+    elif hours > 0:
+        return f"{hours}h {minutes}m"
+    else:
+        return f"{minutes}m"
+
+
+def calculate_eta(eta_seconds):
+    """Format the ETA for full sync, or a placeholder while it is unknown."""
+    if eta_seconds is None:
+        return "⏳ Calculating..."
+    return f"⏳ {format_duration_to_minutes(eta_seconds)} remaining"
+
+
+def _safe_rate(amount, interval, allow_negative=True):
+    """Return amount per unit of interval, or None if the interval is (near) zero or negative.
+
+    With ``allow_negative`` disabled a negative amount also yields None.
+    """
+    if interval <= 1e-6 or (amount < 0 and not allow_negative):
+        return None
+    return amount / interval
+
+
+def blocks_remaining(current_block_number, target_block_number):
+    """Return the number of blocks left to sync, never negative (e.g. after a reorg)."""
+    return max(0, target_block_number - current_block_number)
+
+
+def compute_sync_metrics(
+    node_identifier, current_block_number, target_block_number, measurement_timestamp=None
+):
+    """Calculate sync rate and ETA seconds for a node from a single history sample.
+
+    The ETA is based on an exponential moving average of the sync speed, and is
+    withheld (None) while the speed fluctuates too much to give a meaningful estimate.
+    ``measurement_timestamp`` is the monotonic time the sample was taken (a status's
+    ``sampled_at``); a repeat of the previous sample adds no speed measurement.
+    """
+    global node_block_history
+    if measurement_timestamp is None:
+        measurement_timestamp = time.monotonic()
+
+    sync_rate = "Calculating..."
+    smoothed_sync_speed = None  # First measurement, no previous data
+    sync_speed_variance = 0.0
+    if node_identifier in node_block_history:
+        (
+            previous_block_number,
+            previous_measurement_timestamp,
+            smoothed_sync_speed,
+            sync_speed_variance,
+        ) = node_block_history[node_identifier]
+        # A backwards block delta (reorg, or a node resynced from scratch) is not a rate
+        sync_speed = _safe_rate(
+            current_block_number - previous_block_number,
+            measurement_timestamp - previous_measurement_timestamp,
+            allow_negative=False,
+        )
+
+        if current_block_number < previous_block_number:
+            # Start smoothing afresh from the new height
+            smoothed_sync_speed = None
+            sync_speed_variance = 0.0
+        elif sync_speed is not None:
+            sync_rate = f"{sync_speed:.2f} blocks/sec"
+
+            if smoothed_sync_speed is None:
+                smoothed_sync_speed = sync_speed
+            else:
+                deviation = sync_speed - smoothed_sync_speed
+                smoothed_sync_speed += SYNC_SPEED_SMOOTHING * deviation
+                sync_speed_variance = (1 - SYNC_SPEED_SMOOTHING) * (
+                    sync_speed_variance + SYNC_SPEED_SMOOTHING * deviation**2
+                )
+
+    # Update previous block state
+    node_block_history[node_identifier] = (
+        current_block_number,
+        measurement_timestamp,
+        smoothed_sync_speed,
+        sync_speed_variance,
+    )
+
+    eta_seconds = None
+    if (
+        smoothed_sync_speed is not None
+        and sync_speed_variance**0.5 <= ETA_MAX_SPEED_DEVIATION * smoothed_sync_speed
+    ):
+        eta_seconds = _safe_rate(
+            blocks_remaining(current_block_number, target_block_number),
+            smoothed_sync_speed,
+        )
+
+    return sync_rate, eta_seconds
+
+
+def get_cached_rpc_result(url, methods):
+    """Return a cached RPC result if it is younger than RPC_CACHE_TTL, else None."""
+    with rpc_cache_lock:
+        cached = rpc_cache.get((url, methods))
+    if cached is None:
+        return None
+    cached_timestamp, result = cached
+    if time.monotonic() - cached_timestamp >= RPC_CACHE_TTL:
+        return None
+    return result
+
+
+def cache_rpc_result(url, methods, result, request_timestamp):
+    """Store an RPC result in the short-lived cache, aged from when it was requested."""
+    with rpc_cache_lock:
+        rpc_cache[(url, methods)] = (request_timestamp, result)
+
+
+def post_rpc_request(url, methods):
+    """POST the pre-encoded request for the given methods and return results by id.
+
+    Raises ValueError if the node answers with a JSON-RPC error instead of results.
+    """
+    response = SESSION.post(
+        url, data=RPC_PAYLOADS[methods], headers=JSON_HEADERS, timeout=5
+    )
+    response.raise_for_status()
+
+    rpc_response = orjson.loads(response.content)
+    if not isinstance(rpc_response, list):
+        rpc_response = [rpc_response]  # single-method call or an error object
+    results = {}
+    for item in rpc_response:
+        if not isinstance(item, dict) or "error" in item:
+            error = item.get("error") if isinstance(item, dict) else item
+            raise ValueError(f"RPC error for {', '.join(methods)}: {error}")
+        results[item.get("id")] = item.get("result") or {}
+    return results
+
+
+def fetch_node_status(url, methods=HEALTH_AND_SYNC_METHODS):
+    """Query a Substrate node with a batch of the given RPC methods.
+
+    Falls back to one request per method for nodes that reject batches. Raises
+    requests.RequestException or ValueError (incl. orjson.JSONDecodeError) on failure. Fields
+    for methods that weren't requested are None; ``sampled_at`` is the monotonic time
+    the request was sent, and stays the same for cached repeats.
+    """
+    cached_status = get_cached_rpc_result(url, methods)
+    if cached_status is not None:
+        return cached_status
+
+    # Send the calls as one pre-encoded request (a JSON-RPC batch for several methods),
+    # unless the node is known to reject batches
+    request_timestamp = time.monotonic()
+    results = None
+    if len(methods) == 1 or url not in batch_unsupported_urls:
+        try:
+            results = post_rpc_request(url, methods)
+        except ValueError as e:
+            if len(methods) == 1 or isinstance(e, orjson.JSONDecodeError):
+                raise
+            logger.warning(
+                "⚠️ %s rejected a batch request, polling one method at a time: %s", url, e
+            )
+            batch_unsupported_urls.add(url)
+    if results is None:
+        results = {}
+        for method in methods:
+            results.update(post_rpc_request(url, (method,)))
+
+    node_status = {
+        "is_syncing": None,
+        "peers": None,
+        "current_block": None,
+        "highest_block": None,
+        "sampled_at": request_timestamp,
+    }
+    if "system_health" in methods:
+        health_data = results.get(RPC_REQUESTS["system_health"]["id"], {})
+        node_status["is_syncing"] = health_data.get("isSyncing", True)
+        node_status["peers"] = health_data.get("peers", 0)
+    if "system_syncState" in methods:
+        sync_data = results.get(RPC_REQUESTS["system_syncState"]["id"], {})
+        node_status["current_block"] = sync_data.get("currentBlock")
+        node_status["highest_block"] = sync_data.get("highestBlock")
+
+    cache_rpc_result(url, methods, node_status, request_timestamp)
+    return node_status
+
+
+def get_system_health(node_identifier, url, methods=HEALTH_AND_SYNC_METHODS):
+    """Query a Substrate node for its system health and sync status."""
+    try:
+        return fetch_node_status(url, methods)
+    except (requests.RequestException, ValueError) as e:
+        logger.error("🚨 [%s] Failed to fetch system health: %s", node_identifier, e)
+        return None
+
+
+def check_nodes(use_health=True):
+    """Check the sync status of all nodes and send notifications if needed."""
+    global check_cycle
+
+    # Nodes that have stayed synced only need a health check, except on periodic refreshes
+    is_full_refresh_cycle = check_cycle % FULL_REFRESH_CYCLES == 0
+    check_cycle += 1
+    full_methods = HEALTH_AND_SYNC_METHODS if use_health else SYNC_STATE_METHODS
+    health_only_nodes = {
+        node_identifier
+        for node_identifier in NODES
+        if use_health
+        and SYNCED_NODES[node_identifier]["streak"] >= SYNCED_STREAK_THRESHOLD
+        and not is_full_refresh_cycle
+    }
+
+    futures = {
+        EXECUTOR.submit(
+            get_system_health,
+            node_identifier,
+            node_rpc_endpoint,
+            HEALTH_METHODS if node_identifier in health_only_nodes else full_methods,
+        ): node_identifier
+        for node_identifier, node_rpc_endpoint in NODES.items()
+    }
+
+    # Results are processed here, on the calling thread, so the shared
+    # history and sync state are never mutated concurrently
+    for future in as_completed(futures):
+        node_identifier = futures[future]
+        node_health = future.result()
+        sync_state = SYNCED_NODES[node_identifier]
+
+        if node_health is None:
+            sync_state["streak"] = 0
+            continue  # Skip if there was an error fetching data
+
+        if node_identifier in health_only_nodes:
+            if not node_health.get("is_syncing", True):
+                sync_state["streak"] += 1
+                still_synced_fields = {
+                    "node": node_identifier,
+                    "peers": node_health.get("peers", 0),
+                }
+                logger.info(
+                    "✅ [%(node)s] Still synced | Peers: %(peers)s",
+                    still_synced_fields,
+                    extra={"event": "still_synced", "fields": still_synced_fields},
+                )
+                continue
+
+            # Node started syncing again: fetch its full state right away
+            sync_state["streak"] = 0
+            node_health = get_system_health(
+                node_identifier, NODES[node_identifier], full_methods
+            )
+            if node_health is None:
+                continue
+
+        current_block_number = node_health.get("current_block")
+        target_block_number = node_health.get("highest_block")
+        is_syncing = node_health.get("is_syncing")  # None without system_health
+        peers = node_health.get("peers")
+
+        if (
+            current_block_number is None
+            or target_block_number is None
+            or target_block_number == 0
+        ):
+            sync_state["streak"] = 0
+            continue  # Skip if there was an error fetching data or divide-by-zero risk
+
+        # More strict sync condition: not syncing AND very close to target block
+        is_node_synced = (
+            not is_syncing
+            and current_block_number >= target_block_number - 10  # Allow small buffer
+        )
+
+        sync_rate, eta_seconds = compute_sync_metrics(
+            node_identifier,
+            current_block_number,
+            target_block_number,
+            node_health["sampled_at"],
+        )
+
+        # Only build the status fields when the status line will be logged
+        if logger.isEnabledFor(logging.INFO):
+            remaining_blocks_to_sync = blocks_remaining(
+                current_block_number, target_block_number
+            )
+
+            # Convert block age to seconds (assuming 6 seconds per block)
+            block_age_seconds = remaining_blocks_to_sync * 6
+
+            sync_status_fields = {
+                "node": node_identifier,
+                "current_block": current_block_number,
+                "target_block": target_block_number,
+                "syncing": is_syncing,
+                "peers": peers,
+                "synced": is_node_synced,
+                "eta": calculate_eta(eta_seconds),
+                "progress": round(current_block_number / target_block_number * 100, 2),
+                "blocks_left": remaining_blocks_to_sync,
+                "block_age": format_time_duration(block_age_seconds),
+                "sync_rate": sync_rate,
+            }
+            logger.info(
+                "🔄 [%(node)s] Current: %(current_block)s | Target: %(target_block)s | Syncing: %(syncing)s | Peers: %(peers)s | Synced: %(synced)s | ETA: %(eta)s | Progress: %(progress).2f%% | Blocks Left: %(blocks_left)s | Latest Synced Block Age: %(block_age)s | Sync Rate: %(sync_rate)s",
+                sync_status_fields,
+                extra={"event": "sync_status", "fields": sync_status_fields},
+            )
+
+        # Send notification only when transitioning to a synced state
+        if is_node_synced and not sync_state["synced"]:
+            send_ntfy_notification(node_identifier)
+
+        # Update sync status
+        sync_state["synced"] = is_node_synced
+        sync_state["streak"] = sync_state["streak"] + 1 if is_node_synced else 0
+
+
+def run(nodes_source=CONFIG_FILE, interval=CHECK_INTERVAL, use_health=True):
+    """Monitor the nodes listed in ``nodes_source`` until interrupted.
+
+    With ``use_health`` disabled only ``system_syncState`` is polled, and a node
+    counts as synced once its current block is close to the target.
+    """
+    global CONFIG, CONFIG_FILE, STATE_FILE, NTFY_TOPIC
+
+    setup_logging()
+    CONFIG_FILE = nodes_source
+    STATE_FILE = os.path.join(os.path.dirname(nodes_source), "state.json")
+    CONFIG = load_config(nodes_source)
+    NTFY_TOPIC = CONFIG.get("ntfy_topic", "")
+    NODES.update(load_nodes(CONFIG))
+    for node, data in CONFIG.get("nodes", {}).items():
+        SYNCED_NODES[node] = {"synced": data.get("notified", False), "streak": 0}
+    for node in NODES:
+        SYNCED_NODES.setdefault(node, {"synced": False, "streak": 0})
+
+    logger.info("🚀 Starting sync checker ...")
+    load_state()
+    # Schedule against fixed deadlines so the time spent checking doesn't stretch the interval
+    next_check_deadline = time.monotonic()
+    while True:
+        check_nodes(use_health)
+        save_state()
+
+        next_check_deadline += interval
+        sleep_seconds = next_check_deadline - time.monotonic()
+        if sleep_seconds < 0:
+            # Fell behind by more than a full interval: start a fresh schedule
+            next_check_deadline = time.monotonic()
+            sleep_seconds = 0
+        logger.info("⏳ Sleeping for %.0f seconds...", sleep_seconds)
+        time.sleep(sleep_seconds)
@@ -1,6 +1,6 @@
-import json
+import asyncio
 import time
-import requests
+from pathlib import Path
 from textual.app import App, ComposeResult
 from textual.widgets import Header, Footer, DataTable
 from textual.containers import Container
@@ -8,20 +8,57 @@ from textual.screen import Screen
 from textual.widgets import Static
 from typing import Dict, Optional, Tuple, Any
 
-with open("config/nodes.json", "r", encoding="utf-8") as f:
-    NODES = json.load(f)
+from substrate_sync import (
+    EXECUTOR,
+    SYNC_STATE_METHODS,
+    blocks_remaining,
+    compute_sync_metrics,
+    fetch_node_status,
+    format_duration_to_minutes,
+    load_config,
+    load_nodes,
+)
+
+CONFIG_FILE = Path("config/nodes.json")
+NODES: Dict[str, str] = load_nodes(load_config(CONFIG_FILE))
+nodes_config_mtime = CONFIG_FILE.stat().st_mtime_ns
+
+# Data table columns as (key, label), in display order
+NODE_STATS_COLUMNS = (
+    ("node", "Node"),
+    ("current_block", "Current Block"),
+    ("target_block", "Target Block"),
+    ("sync_percentage", "Sync %"),
+    ("blocks_left", "Blocks Left"),
+    ("sync_rate", "Sync Rate"),
+    ("eta", "ETA"),
+    ("block_age", "Latest Block Age"),
+)
+
+
+def reload_nodes_if_changed() -> None:
+    """Reload NODES when the config file has been modified since it was last read."""
+    global NODES, nodes_config_mtime
+
+    try:
+        config_mtime = CONFIG_FILE.stat().st_mtime_ns
+        if config_mtime == nodes_config_mtime:
+            return
+        NODES = load_nodes(load_config(CONFIG_FILE))
+        nodes_config_mtime = config_mtime
+    except (OSError, ValueError) as e:
+        # Keep monitoring the previous node list until the file is valid again
+        print(f"Error reloading {CONFIG_FILE}: {e}")
 
-# Global variable to track block history
-node_block_history: Dict[str, Tuple[int, float]] = {}
 
 class NodeSyncMonitor(Screen):
     """Main screen for monitoring node synchronization."""
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
-        """Initialize the screen with block history tracking."""
+        """Initialize the screen with row tracking for the stats table."""
         super().__init__(*args, **kwargs)
-        # Track block history for each node
-        self.node_block_history: Dict[str, Tuple[int, float]] = node_block_history
+        # Cell values currently displayed for each node row, keyed by node name
+        self.node_rows: Dict[str, Tuple[str, ...]] = {}
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the screen."""
@@ -33,145 +70,76 @@ class NodeSyncMonitor(Screen):
         """Set up the initial state when the screen mounts."""
         # Configure the data table
         node_stats_table = self.query_one("#node_stats", DataTable)
-        node_stats_table.add_columns(
-            "Node",
-            "Current Block",
-            "Target Block",
-            "Sync %",
-            "Blocks Left",
-            "Sync Rate",
-            "ETA",
-            "Latest Block Age",
-        )
+        for column_key, column_label in NODE_STATS_COLUMNS:
+            node_stats_table.add_column(column_label, key=column_key)
 
         # Start periodic updates
         self.set_interval(5, self.update_node_stats)
 
     def get_sync_status(
         self, node_name: str, url: str
-    ) -> Tuple[Optional[int], Optional[int]]:
-        """Fetch synchronization status for a given Substrate node."""
+    ) -> Tuple[Optional[int], Optional[int], Optional[float]]:
+        """Fetch synchronization status and its sample time for a given Substrate node."""
         try:
-            # Substrate RPC payload to get sync state
-            payload = {
-                "jsonrpc": "2.0",
-                "method": "system_syncState",
-                "params": [],
-                "id": 1,
-            }
-
-            # Send POST request to the node's RPC endpoint
-            response = requests.post(url, json=payload, timeout=5)
-            response.raise_for_status()
-
-            # Parse the response
-            result = response.json().get("result", {})
-            current_block = result.get("currentBlock")
-            highest_block = result.get("highestBlock")
-
-            return current_block, highest_block
+            node_status = fetch_node_status(url, SYNC_STATE_METHODS)
+            return (
+                node_status["current_block"],
+                node_status["highest_block"],
+                node_status["sampled_at"],
+            )
         except Exception as e:
             print(f"Error fetching sync status for {node_name}: {e}")
-            return None, None
-
-    def calculate_sync_rate(self, node_name: str, current_block: int) -> str:
-        """Calculate synchronization rate for a node."""
-        current_time = time.time()
-
-        # Check if we have a previous block measurement
-        if node_name in self.node_block_history:
-            previous_block, previous_time = self.node_block_history[node_name]
-            time_elapsed = current_time - previous_time
-
-            # Calculate blocks per second
-            if time_elapsed > 0:
-                sync_rate = (current_block - previous_block) / time_elapsed
-                return f"{sync_rate:.2f} blocks/sec"
-
-        # Update block history for next iteration
-        self.node_block_history[node_name] = (current_block, current_time)
-
-        return "Calculating..."
-
-    def calculate_eta(self, node_name: str, current_block: int, target_block_number: int) -> str:
-        """Calculate ETA for full sync based on sync speed."""
-        global node_block_history
-
-        if node_name in node_block_history:
-            previous_block_number, previous_measurement_timestamp = node_block_history[node_name]
-            time_elapsed = time.time() - previous_measurement_timestamp
-            sync_speed = (
-                (current_block - previous_block_number) / time_elapsed
-                if time_elapsed > 0
-                else 0
-            )
-        else:
-            sync_speed = None  # First measurement, no previous data
-
-        # Update previous block state
-        node_block_history[node_name] = (current_block, time.time())
-
-        if sync_speed and sync_speed > 0:
-            remaining_blocks_to_sync = target_block_number - current_block
-            eta_seconds = remaining_blocks_to_sync / sync_speed
-
-            # Convert to human-readable time
-            days = int(eta_seconds // 86400)
-            hours = int((eta_seconds % 86400) // 3600)
-            minutes = int((eta_seconds % 3600) // 60)
-
-            if days > 0:
-                return f"{days}d {hours}h {minutes}m"
-            elif hours > 0:
-                return f"{hours}h {minutes}m"
-            else:
-                return f"{minutes}m"
-        else:
-            return "Calculating..."
+            return None, None, None
 
     def calculate_block_age(self, current_block: int, highest_block: int) -> str:
         """Calculate the age of the latest synced block."""
-        blocks_left = highest_block - current_block
+        blocks_left = blocks_remaining(current_block, highest_block)
         # Assuming 6 seconds per block
         total_seconds = blocks_left * 6
 
-        days = int(total_seconds // 86400)
-        hours = int((total_seconds % 86400) // 3600)
-        minutes = int((total_seconds % 3600) // 60)
-
-        if days > 0:
-            return f"{days}d {hours}h {minutes}m"
-        elif hours > 0:
-            return f"{hours}h {minutes}m"
-        else:
-            return f"{minutes}m"
+        return format_duration_to_minutes(total_seconds)
 
-    def update_node_stats(self) -> None:
+    async def update_node_stats(self) -> None:
         """Update node synchronization statistics."""
-        node_stats_table = self.query_one("#node_stats", DataTable)
-        node_stats_table.clear()
+        # Pick up nodes added or removed in the config without a restart
+        reload_nodes_if_changed()
+
+        # Fetch all nodes in parallel off the event loop so the UI stays responsive
+        loop = asyncio.get_running_loop()
+        sync_statuses = await asyncio.gather(
+            *(
+                loop.run_in_executor(EXECUTOR, self.get_sync_status, node_name, url)
+                for node_name, url in NODES.items()
+            )
+        )
 
-        for node_name, url in NODES.items():
-            current_block, highest_block = self.get_sync_status(node_name, url)
+        node_stats_table = self.query_one("#node_stats", DataTable)
+        updated_nodes = set()
 
+        for node_name, (current_block, highest_block, sampled_at) in zip(
+            NODES, sync_statuses
+        ):
             if current_block is None or highest_block is None or highest_block == 0:
                 continue
 
             # Calculate sync percentage
             sync_percentage = (current_block / highest_block) * 100
-            blocks_left = highest_block - current_block
-
-            # Calculate sync rate
-            sync_rate = self.calculate_sync_rate(node_name, current_block)
+            blocks_left = blocks_remaining(current_block, highest_block)
 
-            # Calculate ETA
-            eta = self.calculate_eta(node_name, current_block, highest_block)
+            # Calculate sync rate and ETA
+            sync_rate, eta_seconds = compute_sync_metrics(
+                node_name, current_block, highest_block, sampled_at
+            )
+            eta = (
+                format_duration_to_minutes(eta_seconds)
+                if eta_seconds is not None
+                else "Calculating..."
+            )
 
             # Calculate block age
             block_age = self.calculate_block_age(current_block, highest_block)
 
-            # Add row to the table
-            node_stats_table.add_row(
+            row_values = (
                 node_name,
                 str(current_block),
                 str(highest_block),
@@ -181,6 +149,27 @@ class NodeSyncMonitor(Screen):
                 eta,
                 block_age,
             )
+            updated_nodes.add(node_name)
+
+            previous_values = self.node_rows.get(node_name)
+            if previous_values is None:
+                # First sighting of this node: add its row
+                node_stats_table.add_row(*row_values, key=node_name)
+            else:
+                # Only touch cells whose content changed
+                for (column_key, _), value, previous_value in zip(
+                    NODE_STATS_COLUMNS, row_values, previous_values
+                ):
+                    if value != previous_value:
+                        node_stats_table.update_cell(
+                            node_name, column_key, value, update_width=True
+                        )
+            self.node_rows[node_name] = row_values
+
+        # Drop rows for nodes that were removed or could not be fetched
+        for node_name in set(self.node_rows) - updated_nodes:
+            node_stats_table.remove_row(node_name)
+            del self.node_rows[node_name]
 
         # Update sync summary
         sync_summary = self.query_one("#sync_summary", Static)